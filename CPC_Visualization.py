@@ -1,53 +1,114 @@
 import pymongo
+import matplotlib
+
+# Dashboard output: render headless to this PNG, or set to None for a live, auto-refreshing window
+dashboard_file = 'dashboard.png'
+
+if dashboard_file:
+    # Select Agg before pyplot is imported so no GUI backend is probed
+    matplotlib.use('Agg')
+# Let the renderer drop line segments that would not change any pixel
+matplotlib.rcParams['path.simplify'] = True
+matplotlib.rcParams['path.simplify_threshold'] = 1.0
+
 import matplotlib.pyplot as plt
+import matplotlib.dates as mdates
 import numpy as np
-from datetime import datetime
-from scipy import stats
+from numpy.lib.stride_tricks import sliding_window_view
 
 # MongoDB configuration
 mongo_client = pymongo.MongoClient("mongodb://localhost:27017/")
 db = mongo_client["greenhouse"]
 collection = db["data"]
 
-def calculate_moving_average(data, window=3):
-    """Calculate moving average for smoothing data trends."""
-    return np.convolve(data, np.ones(window)/window, mode='valid')
+# Plot configuration
+max_plot_points = 500
+refresh_interval = 30  # seconds between dashboard refreshes
+sensor_fields = ('temperature', 'humidity', 'soil_moisture', 'light_level', 'co2_level')
+smoothing_weights = None  # e.g. [1, 2, 3] for a weighted moving average; None keeps the 3-point box filter
+
+# Trend narrative configuration (built once, shared by every narrative)
+trend_descriptions = {
+    'temperature': {
+        'increasing': "Temperature is steadily rising, indicating heat accumulation.",
+        'decreasing': "Temperature is declining, suggesting cooling or external climate influences.",
+        'stable': "Temperature remains relatively constant."
+    },
+    'humidity': {
+        'increasing': "Humidity is gradually increasing, potentially indicating higher moisture content.",
+        'decreasing': "Humidity is decreasing, making the environment drier.",
+        'stable': "Humidity remains consistent."
+    },
+    'soil_moisture': {
+        'increasing': "Soil moisture is increasing, possibly due to irrigation or environmental changes.",
+        'decreasing': "Soil moisture is decreasing, which might require attention to plant hydration.",
+        'stable': "Soil moisture remains steady."
+    },
+    'light_level': {
+        'increasing': "Light intensity is continuously increasing, reflecting changing daylight.",
+        'decreasing': "Light intensity is diminishing, possibly due to cloud cover or time of day.",
+        'stable': "Light intensity remains constant."
+    },
+    'co2_level': {
+        'increasing': "CO2 concentration is rising, potentially indicating ventilation issues.",
+        'decreasing': "CO2 concentration is dropping, suggesting good ventilation or plant photosynthesis.",
+        'stable': "CO2 levels remain relatively stable."
+    }
+}
+high_confidence_note = "Trend analysis is highly reliable"
+low_confidence_note = "Trend analysis should be interpreted cautiously"
+
+def calculate_moving_average(data, window=3, out_cum=None):
+    """Calculate moving average for smoothing data trends, optionally reusing a prefix-sum buffer."""
+    # Sliding-window sums from a single prefix sum: O(N) regardless of window size
+    if out_cum is None:
+        out_cum = np.empty(len(data) + 1)
+    c = out_cum[:len(data) + 1]
+    c[0] = 0.0
+    np.cumsum(data, dtype=np.float64, out=c[1:])
+    return (c[window:] - c[:-window]) * (1.0 / window)
+
+def calculate_weighted_average(series, weights):
+    """Calculate a weighted moving average of every row at once; the last weight applies to the newest sample."""
+    weights = np.asarray(weights, dtype=np.float64)
+    weights = weights / weights.sum()
+    if series.shape[-1] < len(weights):
+        return np.empty(series.shape[:-1] + (0,))
+    # Strided (rows, N-W+1, W) view over the data, reduced with a single matmul
+    windows = sliding_window_view(series, len(weights), axis=-1)
+    return windows @ weights
+
+def smooth_series(series, work):
+    """Smooth every sensor series with the configured moving average."""
+    if smoothing_weights is None:
+        return [calculate_moving_average(row, 3, work) for row in series]
+    return calculate_weighted_average(series, smoothing_weights)
+
+def is_flat(y):
+    """Return whether each row of y is constant, so it has no trend worth fitting or drawing."""
+    return np.ptp(y, axis=-1) < 1e-6
 
 def predict_trend(x, y):
-    """Perform linear regression to predict future trend."""
-    slope, intercept, r_value, p_value, std_err = stats.linregress(x, y)
-    return slope, intercept, r_value**2
+    """Perform linear regression on every row of y against a shared x, also flagging constant rows."""
+    # Closed-form least squares for all series at once; the x statistics are shared
+    x = np.asarray(x, dtype=np.float64)
+    y = np.atleast_2d(np.asarray(y, dtype=np.float64))
+    # A constant series is its own exact fit: zero slope through its value, R² = 1
+    flat = is_flat(y)
+    xm = x.mean()
+    dx = x - xm
+    sxx = dx @ dx
+    ym = y.mean(axis=1, keepdims=True)
+    dy = y - ym
+    slope = np.divide(dy @ dx, sxx, out=np.zeros(len(y)), where=~flat)
+    intercept = np.where(flat, y[:, 0], ym.ravel() - slope * xm)
+    ss_tot = (dy * dy).sum(axis=1)
+    # R² = 1 - ss_res/ss_tot with ss_res = ss_tot - slope²·sxx
+    r2 = np.divide(slope * slope * sxx, ss_tot, out=np.ones(len(y)), where=~flat)
+    return slope, intercept, r2, flat
 
 def generate_trend_narrative(parameter, slope, r2):
     """Generate a narrative description of the trend"""
-    trend_descriptions = {
-        'temperature': {
-            'increasing': "Temperature is steadily rising, indicating heat accumulation.",
-            'decreasing': "Temperature is declining, suggesting cooling or external climate influences.",
-            'stable': "Temperature remains relatively constant."
-        },
-        'humidity': {
-            'increasing': "Humidity is gradually increasing, potentially indicating higher moisture content.",
-            'decreasing': "Humidity is decreasing, making the environment drier.",
-            'stable': "Humidity remains consistent."
-        },
-        'soil_moisture': {
-            'increasing': "Soil moisture is increasing, possibly due to irrigation or environmental changes.",
-            'decreasing': "Soil moisture is decreasing, which might require attention to plant hydration.",
-            'stable': "Soil moisture remains steady."
-        },
-        'light_level': {
-            'increasing': "Light intensity is continuously increasing, reflecting changing daylight.",
-            'decreasing': "Light intensity is diminishing, possibly due to cloud cover or time of day.",
-            'stable': "Light intensity remains constant."
-        },
-        'co2_level': {
-            'increasing': "CO2 concentration is rising, potentially indicating ventilation issues.",
-            'decreasing': "CO2 concentration is dropping, suggesting good ventilation or plant photosynthesis.",
-            'stable': "CO2 levels remain relatively stable."
-        }
-    }
-
     # Determine trend direction
     if abs(slope) < 0.01:
         trend = 'stable'
@@ -57,119 +118,295 @@ def generate_trend_narrative(parameter, slope, r2):
         trend = 'decreasing'
 
     # Add confidence note based on R²
-    confidence_note = "Trend analysis is highly reliable" if r2 > 0.7 else "Trend analysis should be interpreted cautiously"
+    confidence_note = high_confidence_note if r2 > 0.7 else low_confidence_note
 
     return f"{trend_descriptions[parameter][trend]} {confidence_note}, statistical fit R² = {r2:.2f}."
 
-def create_visualization():
-    # Initialize lists to store data
-    timestamps = []
-    temperatures = []
-    humidities = []
-    soil_moistures = []
-    light_levels = []
-    co2_levels = []
+def downsample(collection, target_points=500):
+    """Bucket readings by time on the server, returning per-bucket mean/min/max series."""
+    match = {"data": {"$exists": True}}
+    first = collection.find_one(match, sort=[("timestamp", pymongo.ASCENDING)])
+    last = collection.find_one(match, sort=[("timestamp", pymongo.DESCENDING)])
+    if first is None:
+        empty = {field: np.array([], dtype=np.float32) for field in sensor_fields}
+        return np.array([], dtype='datetime64[m]'), empty, dict(empty), dict(empty)
+
+    # Choose a bucket width (in minutes) that yields roughly target_points buckets
+    span = (np.datetime64(last['timestamp'], 'm') - np.datetime64(first['timestamp'], 'm')).astype(int)
+    bin_size = max(1, -(-int(span) // target_points))
 
+    group = {"_id": {"$dateTrunc": {"date": {"$toDate": "$timestamp"}, "unit": "minute", "binSize": bin_size}}}
+    for field in sensor_fields:
+        group[f"{field}_avg"] = {"$avg": f"$data.{field}"}
+        group[f"{field}_min"] = {"$min": f"$data.{field}"}
+        group[f"{field}_max"] = {"$max": f"$data.{field}"}
+
+    buckets = list(collection.aggregate([
+        {"$match": match},
+        {"$group": group},
+        {"$sort": {"_id": 1}}
+    ]))
+
+    ts = np.array([b['_id'] for b in buckets], dtype='datetime64[m]')
+    means = {f: np.array([b[f"{f}_avg"] for b in buckets], dtype=np.float32) for f in sensor_fields}
+    lows = {f: np.array([b[f"{f}_min"] for b in buckets], dtype=np.float32) for f in sensor_fields}
+    highs = {f: np.array([b[f"{f}_max"] for b in buckets], dtype=np.float32) for f in sensor_fields}
+    return ts, means, lows, highs
+
+def load_series(collection):
+    """Fetch timestamps and a (sensor, sample) matrix of readings, downsampling large collections."""
+    # Cheap size hint so the series buffers can be preallocated
+    n = collection.estimated_document_count()
+
+    if n > max_plot_points:
+        # Too many samples for the canvas: plot time-bucketed mean with a min/max band
+        ts, means, lows, highs = downsample(collection, max_plot_points)
+        series = np.vstack([means[field] for field in sensor_fields])
+    else:
+        lows = highs = None
+        if n == 0:
+            return np.array([], dtype='datetime64[m]'), np.empty((len(sensor_fields), 0), dtype=np.float32), lows, highs
+
+        # One contiguous float32 row per sensor, plus a datetime64 column
+        ts = np.empty(n, dtype='datetime64[m]')
+        series = np.empty((len(sensor_fields), n), dtype=np.float32)
+        temperatures, humidities, soil_moistures, light_levels, co2_levels = series
+
+        # Filter, sort and project on the server so only the plotted fields cross the wire
+        documents = collection.aggregate([
+            {"$match": {"data": {"$exists": True}}},
+            {"$sort": {"timestamp": 1}},
+            {"$project": {
+                "_id": 0,
+                "t": "$timestamp",
+                "T": "$data.temperature",
+                "H": "$data.humidity",
+                "S": "$data.soil_moisture",
+                "L": "$data.light_level",
+                "C": "$data.co2_level"
+            }}
+        ], batchSize=10000)
+
+        # Write each document straight into its preallocated slot
+        count = 0
+        for d in documents:
+            if count == len(ts):
+                # The size hint was stale: grow the buffers rather than drop the newest readings
+                ts = np.concatenate([ts, np.empty(len(ts), dtype=ts.dtype)])
+                series = np.concatenate([series, np.empty(series.shape, dtype=series.dtype)], axis=1)
+                temperatures, humidities, soil_moistures, light_levels, co2_levels = series
+            ts[count] = d['t']
+            temperatures[count] = d['T']
+            humidities[count] = d['H']
+            soil_moistures[count] = d['S']
+            light_levels[count] = d['L']
+            co2_levels[count] = d['C']
+            count += 1
+
+        ts = ts[:count]
+        series = series[:, :count]
+
+    return ts, series, lows, highs
+
+def create_visualization():
     try:
-        # Fetch all documents from MongoDB
-        documents = collection.find()
-        
-        # Process each document
-        for doc in documents:
-            if 'data' in doc:
-                # Extract timestamp
-                timestamp_str = doc['timestamp']
-                dt = datetime.fromisoformat(timestamp_str)
-                time_only = dt.strftime('%H:%M')
-                timestamps.append(time_only)
-                
-                # Extract sensor data
-                data = doc['data']
-                temperatures.append(data['temperature'])
-                humidities.append(data['humidity'])
-                soil_moistures.append(data['soil_moisture'])
-                light_levels.append(data['light_level'])
-                co2_levels.append(data['co2_level'])
-
-        if timestamps:
+        # Serve the timestamp sorts below from an index rather than a collection scan
+        collection.create_index([("timestamp", pymongo.ASCENDING)])
+
+        ts, series, lows, highs = load_series(collection)
+
+        # Row views into the shared buffer; no copies are made from here on
+        temperatures, humidities, soil_moistures, light_levels, co2_levels = series
+
+        if len(ts):
             # Convert timestamps to numeric for trend analysis
-            x = np.arange(len(timestamps))
+            x = np.arange(len(ts))
+
+            # Fit all five trends in one pass over the stacked series
+            slopes, intercepts, r2s, flat = predict_trend(x, series)
+            temp_slope, hum_slope, soil_slope, light_slope, co2_slope = slopes
+            temp_intercept, hum_intercept, soil_intercept, light_intercept, co2_intercept = intercepts
+            temp_r2, hum_r2, soil_r2, light_r2, co2_r2 = r2s
 
             # Create subplots with increased height
             fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 12))
             fig.suptitle('Greenhouse Environmental Monitoring Dashboard', fontsize=16)
+            bands = []
+
+            # Moving averages for all five series; the box filter shares one prefix-sum buffer
+            work = np.empty(len(ts) + 1)
+            temp_ma, hum_ma, soil_ma, light_ma, co2_ma = smooth_series(series, work)
 
             # Temperature and Humidity Plot with Trend
-            temp_ma = calculate_moving_average(temperatures)
-            hum_ma = calculate_moving_average(humidities)
-            
-            ax1.plot(timestamps, temperatures, 'r-', label='Temperature (°C)')
-            ax1.plot(timestamps[len(timestamps)-len(temp_ma):], temp_ma, 'r--', label='Temp Moving Avg')
+            if lows is not None:
+                bands.append(ax1.fill_between(ts, lows['temperature'], highs['temperature'], color='r', alpha=0.2))
+            temp_line, = ax1.plot(ts, temperatures, 'r-', label='Temperature (°C)')
+            temp_ma_line, = ax1.plot(ts[len(ts)-len(temp_ma):], temp_ma, 'r--', label='Temp Moving Avg')
             
             ax1_twin = ax1.twinx()
-            ax1_twin.plot(timestamps, humidities, 'b-', label='Humidity (%)')
-            ax1_twin.plot(timestamps[len(timestamps)-len(hum_ma):], hum_ma, 'b--', label='Humidity Moving Avg')
+            if lows is not None:
+                bands.append(ax1_twin.fill_between(ts, lows['humidity'], highs['humidity'], color='b', alpha=0.2))
+            hum_line, = ax1_twin.plot(ts, humidities, 'b-', label='Humidity (%)')
+            hum_ma_line, = ax1_twin.plot(ts[len(ts)-len(hum_ma):], hum_ma, 'b--', label='Humidity Moving Avg')
             
-            # Temperature Trend Prediction
-            temp_slope, temp_intercept, temp_r2 = predict_trend(x, temperatures)
-            pred_temp = temp_slope * x + temp_intercept
-            ax1.plot(timestamps, pred_temp, 'r:', label=f'Temp Trend (R²={temp_r2:.2f})')
+            # Temperature Trend Prediction; constant series get no overlay (the live view
+            # keeps a hidden line so a later refresh can show it)
+            temp_trend_line = None
+            if not (dashboard_file and flat[0]):
+                pred_temp = temp_slope * x + temp_intercept
+                temp_trend_line, = ax1.plot(ts, pred_temp, 'r:', label=f'Temp Trend (R²={temp_r2:.2f})', visible=not flat[0])
 
             ax1.set_title('Temperature and Humidity Trends')
             ax1.set_xlabel('Time')
             ax1.set_ylabel('Temperature (°C)', color='r')
             ax1_twin.set_ylabel('Humidity (%)', color='b')
-            
-            # Combine legends
-            lines1, labels1 = ax1.get_legend_handles_labels()
-            lines2, labels2 = ax1_twin.get_legend_handles_labels()
-            ax1.legend(lines1 + lines2, labels1 + labels2, loc='best', fontsize='small')
 
             # Soil Moisture Plot with Trend
-            soil_ma = calculate_moving_average(soil_moistures)
-            soil_slope, soil_intercept, soil_r2 = predict_trend(x, soil_moistures)
-            pred_soil = soil_slope * x + soil_intercept
-            
-            ax2.plot(timestamps, soil_moistures, 'g-', label='Soil Moisture (%)')
-            ax2.plot(timestamps[len(timestamps)-len(soil_ma):], soil_ma, 'g--', label='Moisture Moving Avg')
-            ax2.plot(timestamps, pred_soil, 'g:', label=f'Moisture Trend (R²={soil_r2:.2f})')
+            if lows is not None:
+                bands.append(ax2.fill_between(ts, lows['soil_moisture'], highs['soil_moisture'], color='g', alpha=0.2))
+            soil_line, = ax2.plot(ts, soil_moistures, 'g-', label='Soil Moisture (%)')
+            soil_ma_line, = ax2.plot(ts[len(ts)-len(soil_ma):], soil_ma, 'g--', label='Moisture Moving Avg')
+            soil_trend_line = None
+            if not (dashboard_file and flat[2]):
+                pred_soil = soil_slope * x + soil_intercept
+                soil_trend_line, = ax2.plot(ts, pred_soil, 'g:', label=f'Moisture Trend (R²={soil_r2:.2f})', visible=not flat[2])
             ax2.set_title('Soil Moisture Trends')
             ax2.set_xlabel('Time')
             ax2.set_ylabel('Moisture (%)')
-            ax2.legend(fontsize='small')
 
             # Light Level Plot with Trend
-            light_ma = calculate_moving_average(light_levels)
-            light_slope, light_intercept, light_r2 = predict_trend(x, light_levels)
-            pred_light = light_slope * x + light_intercept
-            
-            ax3.plot(timestamps, light_levels, 'y-', label='Light (lux)')
-            ax3.plot(timestamps[len(timestamps)-len(light_ma):], light_ma, 'y--', label='Light Moving Avg')
-            ax3.plot(timestamps, pred_light, 'y:', label=f'Light Trend (R²={light_r2:.2f})')
+            if lows is not None:
+                bands.append(ax3.fill_between(ts, lows['light_level'], highs['light_level'], color='y', alpha=0.2))
+            light_line, = ax3.plot(ts, light_levels, 'y-', label='Light (lux)')
+            light_ma_line, = ax3.plot(ts[len(ts)-len(light_ma):], light_ma, 'y--', label='Light Moving Avg')
+            light_trend_line = None
+            if not (dashboard_file and flat[3]):
+                pred_light = light_slope * x + light_intercept
+                light_trend_line, = ax3.plot(ts, pred_light, 'y:', label=f'Light Trend (R²={light_r2:.2f})', visible=not flat[3])
             ax3.set_title('Light Level Trends')
             ax3.set_xlabel('Time')
             ax3.set_ylabel('Light (lux)')
-            ax3.legend(fontsize='small')
 
             # CO2 Level Plot with Trend
-            co2_ma = calculate_moving_average(co2_levels)
-            co2_slope, co2_intercept, co2_r2 = predict_trend(x, co2_levels)
-            pred_co2 = co2_slope * x + co2_intercept
-            
-            ax4.plot(timestamps, co2_levels, 'm-', label='CO2 (ppm)')
-            ax4.plot(timestamps[len(timestamps)-len(co2_ma):], co2_ma, 'm--', label='CO2 Moving Avg')
-            ax4.plot(timestamps, pred_co2, 'm:', label=f'CO2 Trend (R²={co2_r2:.2f})')
+            if lows is not None:
+                bands.append(ax4.fill_between(ts, lows['co2_level'], highs['co2_level'], color='m', alpha=0.2))
+            co2_line, = ax4.plot(ts, co2_levels, 'm-', label='CO2 (ppm)')
+            co2_ma_line, = ax4.plot(ts[len(ts)-len(co2_ma):], co2_ma, 'm--', label='CO2 Moving Avg')
+            co2_trend_line = None
+            if not (dashboard_file and flat[4]):
+                pred_co2 = co2_slope * x + co2_intercept
+                co2_trend_line, = ax4.plot(ts, pred_co2, 'm:', label=f'CO2 Trend (R²={co2_r2:.2f})', visible=not flat[4])
             ax4.set_title('CO2 Level Trends')
             ax4.set_xlabel('Time')
             ax4.set_ylabel('CO2 (ppm)')
-            ax4.legend(fontsize='small')
 
-            # Rotate x-axis labels
+            def build_legends():
+                """Build each panel's legend from its visible lines, so hidden trends leave no empty rows."""
+                legends = []
+                for ax, panel_lines in [(ax1, list(ax1.get_lines()) + list(ax1_twin.get_lines())), (ax2, ax2.get_lines()), (ax3, ax3.get_lines()), (ax4, ax4.get_lines())]:
+                    handles = [line for line in panel_lines if line.get_visible()]
+                    legends.append(ax.legend(handles, [line.get_label() for line in handles], loc='best', fontsize='small'))
+                return legends
+
+            # Combine temperature and humidity into one legend
+            legends = build_legends()
+
+            # Date axis: let matplotlib pick a handful of ticks instead of one per sample
             for ax in [ax1, ax2, ax3, ax4]:
-                ax.tick_params(axis='x', rotation=45)
+                locator = mdates.AutoDateLocator()
+                ax.xaxis.set_major_locator(locator)
+                ax.xaxis.set_major_formatter(mdates.ConciseDateFormatter(locator))
 
             plt.tight_layout()
-            plt.show()
+
+            if dashboard_file:
+                # Headless: write the dashboard once; the live refresh below needs a window
+                fig.savefig(dashboard_file, dpi=100, bbox_inches='tight')
+                plt.close(fig)
+                print(f"Dashboard saved to {dashboard_file}")
+            else:
+                # Refreshes only redraw the data; the rest of each panel is cached as a bitmap
+                panels = [(ax1, 'r'), (ax1_twin, 'b'), (ax2, 'g'), (ax3, 'y'), (ax4, 'm')]
+                data_lines = [
+                    (temp_line, temp_ma_line, temp_trend_line),
+                    (hum_line, hum_ma_line, None),
+                    (soil_line, soil_ma_line, soil_trend_line),
+                    (light_line, light_ma_line, light_trend_line),
+                    (co2_line, co2_ma_line, co2_trend_line)
+                ]
+                lines = [line for group in data_lines for line in group if line is not None]
+                for artist in lines + legends + bands:
+                    artist.set_animated(True)
+                backgrounds = []
+
+                def draw_dynamic():
+                    for artist in bands + lines + legends:
+                        artist.axes.draw_artist(artist)
+
+                def on_draw(event):
+                    # A full draw (first show, resize, rescale) invalidates the cached backgrounds
+                    backgrounds[:] = [fig.canvas.copy_from_bbox(ax.bbox) for ax in [ax1, ax2, ax3, ax4]]
+                    draw_dynamic()
+
+                def refresh():
+                    # A bad batch (missing fields, malformed values) should skip one refresh, not stop the timer
+                    try:
+                        ts, series, lows, highs = load_series(collection)
+                    except (pymongo.errors.PyMongoError, KeyError, IndexError, TypeError, ValueError) as e:
+                        print(f"Refresh failed: {str(e)}")
+                        return
+                    if not len(ts):
+                        return
+
+                    # Reuse the existing artists instead of plotting new ones
+                    x = np.arange(len(ts))
+                    work = np.empty(len(ts) + 1)
+                    slopes, intercepts, r2s, flat = predict_trend(x, series)
+                    smoothed = smooth_series(series, work)
+                    for (line, ma_line, trend_line), y, ma, slope, intercept, r2, is_constant in zip(data_lines, series, smoothed, slopes, intercepts, r2s, flat):
+                        line.set_data(ts, y)
+                        ma_line.set_data(ts[len(ts)-len(ma):], ma)
+                        if trend_line is not None:
+                            trend_line.set_data(ts, slope * x + intercept)
+                            trend_line.set_visible(not is_constant)
+                            trend_line.set_label(f"{trend_line.get_label().split(' (R²=')[0]} (R²={r2:.2f})")
+
+                    # New R² values and shown/hidden trends need fresh legends
+                    legends[:] = build_legends()
+                    for legend in legends:
+                        legend.set_animated(True)
+
+                    # Min/max bands are polygons, so they are rebuilt rather than updated
+                    for band in bands:
+                        band.remove()
+                    bands.clear()
+                    if lows is not None:
+                        for (ax, color), field in zip(panels, sensor_fields):
+                            bands.append(ax.fill_between(ts, lows[field], highs[field], color=color, alpha=0.2, animated=True))
+
+                    # New data outside the current view needs a full redraw to move the axes
+                    rescaled = False
+                    for ax, _ in panels:
+                        view = ax.viewLim.bounds
+                        ax.relim()
+                        ax.autoscale_view()
+                        rescaled = rescaled or not np.allclose(view, ax.viewLim.bounds)
+
+                    if rescaled or not backgrounds:
+                        fig.canvas.draw_idle()
+                    else:
+                        for background in backgrounds:
+                            fig.canvas.restore_region(background)
+                        draw_dynamic()
+                        for ax in [ax1, ax2, ax3, ax4]:
+                            fig.canvas.blit(ax.bbox)
+
+                fig.canvas.mpl_connect('draw_event', on_draw)
+                timer = fig.canvas.new_timer(interval=refresh_interval * 1000)
+                timer.add_callback(refresh)
+                timer.start()
+
+                plt.show()
             
             trend_narratives = {
                 'temperature': generate_trend_narrative('temperature', temp_slope, temp_r2),
@@ -1,8 +1,9 @@
 import pymongo
-import paho.mqtt.client as mqtt
-from datetime import datetime, timezone, timedelta
-import time
+import paho.mqtt.publish as publish
+from datetime import datetime, timezone
 import numpy as np
+import struct
+import asyncio
 
 # MongoDB configuration
 mongo_client = pymongo.MongoClient("mongodb://localhost:27017/")
@@ -12,11 +13,15 @@ collection = db["data"]
 # MQTT configuration
 mqtt_broker_address = "34.41.126.16"
 mqtt_topic = "greenhouse"
+# Binary payload: epoch seconds, temperature x10, humidity, soil moisture, light, CO2 (18 bytes)
+mqtt_payload_format = "<QhBBIH"
+
+# Print every published reading (off by default to keep the send path free of console I/O)
+verbose = False
 
 def generate_data():
     """Generate 24 hours of greenhouse environmental data with 30-minute intervals"""
     start_time = datetime(2025, 1, 21, 0, 0, 0)
-    documents = []
     
     # Base values optimized for greenhouse conditions
     temp = 25.0  # Starting temperature (°C)
@@ -25,79 +30,100 @@ def generate_data():
     light_level = 0  # Starting light level (lux)
     co2_level = 800  # Starting CO2 level (ppm)
     
-    # Generate data for every 30 minutes (48 points for 24 hours)
-    for i in range(48):
-        current_time = start_time + timedelta(minutes=30 * i)
-        hour = current_time.hour
-        
-        # Temperature cycle (peaks at 2 PM)
-        temp_cycle = 4 * np.sin((hour - 6) * np.pi / 12)
-        
-        # Light level cycle (follows sun pattern)
-        if 6 <= hour <= 18:
-            light_cycle = 50000 * np.sin((hour - 6) * np.pi / 12)
-        else:
-            light_cycle = 0
-            
-        # CO2 cycle (inverse to light - plants consume CO2 during day)
-        co2_cycle = -200 * np.sin((hour - 6) * np.pi / 12)
-        
-        # Add random variations
-        temp_variation = np.random.normal(0, 0.3)
-        humidity_variation = np.random.normal(0, 2)
-        soil_moisture_variation = np.random.normal(0, 1)
-        light_variation = np.random.normal(0, 1000)
-        co2_variation = np.random.normal(0, 50)
-        
-        # Calculate final values with bounds
-        final_temp = round(max(min(temp + temp_cycle + temp_variation, 35), 15), 1)
-        final_humidity = int(min(max(humidity + humidity_variation, 60), 90))
-        final_soil_moisture = int(min(max(soil_moisture + soil_moisture_variation, 50), 80))
-        final_light = max(int(light_level + light_cycle + light_variation), 0)
-        final_co2 = max(int(co2_level + co2_cycle + co2_variation), 400)
-        
-        # Create document
-        doc = {
-            "timestamp": current_time.isoformat(),
+    # Hour of day for every 30-minute slot (48 points for 24 hours)
+    hours = np.arange(48) // 2
+    phase = np.sin((hours - 6) * np.pi / 12)
+    
+    # Temperature cycle (peaks at 2 PM)
+    temp_cycle = 4 * phase
+    
+    # Light level cycle (follows sun pattern)
+    light_cycle = np.where((hours >= 6) & (hours <= 18), 50000 * phase, 0)
+    
+    # CO2 cycle (inverse to light - plants consume CO2 during day)
+    co2_cycle = -200 * phase
+    
+    # Draw all random variations at once: temperature, humidity, soil moisture, light, CO2
+    rng = np.random.default_rng()
+    noise = rng.standard_normal((48, 5)) * np.array([0.3, 2, 1, 1000, 50])
+    
+    # Calculate final values with bounds for all 48 points at once
+    final_temps = np.round(np.clip(temp + temp_cycle + noise[:, 0], 15, 35), 1).tolist()
+    final_humidities = np.clip(humidity + noise[:, 1], 60, 90).astype(int).tolist()
+    final_soil_moistures = np.clip(soil_moisture + noise[:, 2], 50, 80).astype(int).tolist()
+    final_lights = np.maximum((light_level + light_cycle + noise[:, 3]).astype(int), 0).tolist()
+    final_co2s = np.maximum((co2_level + co2_cycle + noise[:, 4]).astype(int), 400).tolist()
+    
+    # Timestamps for every 30 minutes
+    timestamps = np.datetime_as_string(
+        np.datetime64(start_time, 's') + np.arange(48) * np.timedelta64(30, 'm'), unit='s'
+    ).tolist()
+    
+    # Create documents (the display string is derived on read, not stored)
+    return [
+        {
+            "timestamp": timestamps[i],
             "data": {
-                "temperature": final_temp,
-                "humidity": final_humidity,
-                "soil_moisture": final_soil_moisture,
-                "light_level": final_light,
-                "co2_level": final_co2
-            },
-            "formatted_data": (
-                f"Timestamp: {current_time.strftime('%Y-%m-%d %H:%M:%S')}, "
-                f"Temperature: {final_temp}°C, "
-                f"Humidity: {final_humidity}%, "
-                f"Soil Moisture: {final_soil_moisture}%, "
-                f"Light: {final_light} lux, "
-                f"CO2: {final_co2} ppm"
-            )
+                "temperature": final_temps[i],
+                "humidity": final_humidities[i],
+                "soil_moisture": final_soil_moistures[i],
+                "light_level": final_lights[i],
+                "co2_level": final_co2s[i]
+            }
         }
-        documents.append(doc)
-    
-    return documents
+        for i in range(48)
+    ]
+
+def format_reading(doc):
+    """Format a generated document as a human-readable line."""
+    data = doc["data"]
+    return (
+        f"Timestamp: {doc['timestamp'].replace('T', ' ')}, "
+        f"Temperature: {data['temperature']}°C, "
+        f"Humidity: {data['humidity']}%, "
+        f"Soil Moisture: {data['soil_moisture']}%, "
+        f"Light: {data['light_level']} lux, "
+        f"CO2: {data['co2_level']} ppm"
+    )
 
-def on_connect(client, userdata, flags, reason_code, properties=None):
-    if reason_code == 0:
-        print("Connected successfully to MQTT broker")
-    else:
-        print(f"Connection failed with reason code {reason_code}")
+def encode_payload(doc):
+    """Pack a generated document into the fixed-layout binary MQTT payload."""
+    data = doc["data"]
+    timestamp = datetime.fromisoformat(doc["timestamp"]).replace(tzinfo=timezone.utc)
+    return struct.pack(
+        mqtt_payload_format,
+        int(timestamp.timestamp()),
+        int(round(data["temperature"] * 10)),
+        data["humidity"],
+        data["soil_moisture"],
+        data["light_level"],
+        data["co2_level"]
+    )
 
-def on_publish(client, userdata, mid):
-    print(f"Message {mid} published successfully")
+def decode_payload(payload):
+    """Unpack a binary MQTT payload back into a document like the ones in MongoDB."""
+    epoch, temperature, humidity, soil_moisture, light_level, co2_level = struct.unpack(mqtt_payload_format, payload)
+    return {
+        "timestamp": datetime.fromtimestamp(epoch, timezone.utc).replace(tzinfo=None).isoformat(),
+        "data": {
+            "temperature": temperature / 10,
+            "humidity": humidity,
+            "soil_moisture": soil_moisture,
+            "light_level": light_level,
+            "co2_level": co2_level
+        }
+    }
+
+async def store_and_publish(documents, messages):
+    """Bulk-insert into MongoDB and publish to MQTT concurrently, since both wait on the network."""
+    print(f"Storing in MongoDB and publishing to MQTT broker at {mqtt_broker_address}")
+    await asyncio.gather(
+        asyncio.to_thread(collection.insert_many, documents, ordered=False),
+        asyncio.to_thread(publish.multiple, messages, hostname=mqtt_broker_address, port=1883, keepalive=60)
+    )
 
 def send_data():
-    client = mqtt.Client()
-    client.on_connect = on_connect
-    client.on_publish = on_publish
-    
     try:
-        print(f"Connecting to MQTT broker at {mqtt_broker_address}")
-        client.connect(mqtt_broker_address, 1883, 60)
-        client.loop_start()
-        
         print("Generating greenhouse environmental data...")
         sample_data = generate_data()
         
@@ -105,28 +131,21 @@ def send_data():
         collection.delete_many({})
         print("Cleared existing data from MongoDB")
         
-        for doc in sample_data:
-            # Add current sending timestamp
-            send_timestamp = datetime.now(timezone.utc).isoformat()
-            
-            # Publish to MQTT with structured data
-            print(f"Publishing: {doc['formatted_data']}")
-            client.publish(mqtt_topic, doc['formatted_data'])
-            
-            # Store in MongoDB
-            collection.insert_one(doc)
-            
-            # Delay between messages
-            time.sleep(1)
+        # Index timestamps so the dashboard can sort and range-query without a collection scan
+        collection.create_index([("timestamp", pymongo.ASCENDING)])
+        
+        # Queue for MQTT as compact binary frames
+        messages = [{"topic": mqtt_topic, "payload": encode_payload(doc)} for doc in sample_data]
+        if verbose:
+            for doc in sample_data:
+                print(f"Publishing: {format_reading(doc)}")
+        
+        asyncio.run(store_and_publish(sample_data, messages))
             
         print(f"Successfully processed {len(sample_data)} data points")
             
     except Exception as e:
         print(f"Error occurred: {e}")
-    finally:
-        client.loop_stop()
-        client.disconnect()
-        print("Disconnected from MQTT broker")
 
 if __name__ == "__main__":
     send_data()
\ No newline at end of file